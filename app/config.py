@@ -24,6 +24,13 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRY_SECONDS: int = 3600
 
+    # Email-existence Bloom filter (per worker, loaded at startup)
+    EMAIL_FILTER_ENABLED: bool = True
+    EMAIL_FILTER_ERROR_RATE: float = Field(default=0.01, gt=0, lt=1)
+    EMAIL_FILTER_HEADROOM: float = Field(
+        default=2.0, ge=1, description="Capacity multiplier over current user count"
+    )
+
 
 @lru_cache
 def get_settings() -> Settings:
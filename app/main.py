@@ -11,6 +11,7 @@ from app.config import settings
 from app.database import engine
 from app.models.user import Base
 from app.routers import auth, health, users
+from app.services.email_filter import email_filter
 
 logger = structlog.get_logger(__name__)
 
@@ -20,6 +21,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("user_service_starting", version=settings.APP_VERSION)
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    if settings.EMAIL_FILTER_ENABLED:
+        await email_filter.rebuild(engine)
     yield
     logger.info("user_service_shutdown")
     await engine.dispose()
@@ -3,7 +3,7 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, String, func
+from sqlalchemy import Boolean, DateTime, Index, String, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
@@ -20,7 +20,9 @@ class User(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
-    email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
+    # Stored lowercased; uniqueness is enforced case-insensitively by
+    # uq_usr_users_email_lower so legacy mixed-case rows still collide.
+    email: Mapped[str] = mapped_column(String(255), nullable=False)
     hashed_password: Mapped[str] = mapped_column(String(255), nullable=False)
     full_name: Mapped[str] = mapped_column(String(255), nullable=False)
     phone: Mapped[str | None] = mapped_column(String(20), nullable=True)
@@ -37,5 +39,9 @@ class User(Base):
         nullable=False,
     )
 
+    __table_args__ = (
+        Index("uq_usr_users_email_lower", func.lower(email), unique=True),
+    )
+
     def __repr__(self) -> str:
         return f"<User id={self.id} email={self.email} role={self.role}>"
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import hashlib
+import math
+import time
+
+import structlog
+from prometheus_client import Counter, Gauge
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.config import settings
+from app.models.user import User
+
+logger = structlog.get_logger(__name__)
+
+EMAIL_FILTER_ESTIMATED_FPR = Gauge(
+    "usr_email_filter_estimated_false_positive_rate",
+    "Theoretical false-positive rate of the email-existence Bloom filter",
+)
+EMAIL_FILTER_ENTRIES = Gauge(
+    "usr_email_filter_entries",
+    "Number of emails inserted into the email-existence Bloom filter",
+)
+EMAIL_FILTER_REBUILD_SECONDS = Gauge(
+    "usr_email_filter_rebuild_seconds",
+    "Wall-clock duration of the last email-existence Bloom filter rebuild",
+)
+EMAIL_FILTER_LOOKUPS = Counter(
+    "usr_email_filter_lookups_total",
+    "Email-existence filter lookups during registration, by outcome "
+    "(unavailable, negative, positive, false_positive)",
+    ["outcome"],
+)
+
+
+def normalize_email(email: str) -> str:
+    """Return the canonical form used for storage and lookups."""
+    return email.strip().lower()
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over normalized email addresses.
+
+    Answers "definitely absent" or "possibly present". Sized from the
+    expected number of entries and the target false-positive rate.
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        capacity = max(capacity, 1)
+        self.num_bits = max(
+            8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        )
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, item: str) -> list[int]:
+        # Kirsch–Mitzenmacher double hashing from a single 128-bit digest.
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item)
+        )
+
+    @property
+    def estimated_false_positive_rate(self) -> float:
+        fill = 1 - math.exp(-self.num_hashes * self.count / self.num_bits)
+        return fill**self.num_hashes
+
+
+class EmailExistenceFilter:
+    """Per-worker set of registered emails, used to skip duplicate pre-checks.
+
+    Until :meth:`rebuild` has completed every lookup reports "possibly
+    present", so callers fall back to the database. The filter is only an
+    optimization for registration — the unique index on ``lower(email)``
+    remains the source of truth.
+    """
+
+    def __init__(self, error_rate: float = 0.01, headroom: float = 2.0) -> None:
+        self._error_rate = error_rate
+        self._headroom = headroom
+        self._capacity = 0
+        self._bloom: BloomFilter | None = None
+
+    @property
+    def ready(self) -> bool:
+        return self._bloom is not None
+
+    def might_contain(self, email: str) -> bool:
+        if self._bloom is None:
+            EMAIL_FILTER_LOOKUPS.labels(outcome="unavailable").inc()
+            return True
+        if normalize_email(email) not in self._bloom:
+            EMAIL_FILTER_LOOKUPS.labels(outcome="negative").inc()
+            return False
+        EMAIL_FILTER_LOOKUPS.labels(outcome="positive").inc()
+        return True
+
+    def record_false_positive(self) -> None:
+        """Count a "possibly present" answer that the database contradicted."""
+        if self._bloom is not None:
+            EMAIL_FILTER_LOOKUPS.labels(outcome="false_positive").inc()
+
+    def add(self, email: str) -> None:
+        if self._bloom is None:
+            return
+        self._bloom.add(normalize_email(email))
+        if self._bloom.count == self._capacity + 1:
+            logger.warning(
+                "email_filter_over_capacity",
+                entries=self._bloom.count,
+                capacity=self._capacity,
+            )
+        self._publish()
+
+    async def rebuild(self, engine: AsyncEngine, batch_size: int = 5000) -> None:
+        """Stream every stored email into a fresh filter, then swap it in.
+
+        Only called from startup, before the worker serves requests, so no
+        registration can race with the load.
+        """
+        started = time.perf_counter()
+        async with engine.connect() as conn:
+            existing = await conn.scalar(select(func.count()).select_from(User))
+            capacity = max(int((existing or 0) * self._headroom), 1024)
+            bloom = BloomFilter(capacity, self._error_rate)
+            result = await conn.stream_scalars(
+                select(func.lower(User.email)).execution_options(yield_per=batch_size)
+            )
+            async for email in result:
+                bloom.add(email)
+        self._capacity = capacity
+        self._bloom = bloom
+        elapsed = time.perf_counter() - started
+        EMAIL_FILTER_REBUILD_SECONDS.set(elapsed)
+        self._publish()
+        logger.info(
+            "email_filter_rebuilt",
+            entries=bloom.count,
+            capacity=capacity,
+            bits=bloom.num_bits,
+            hashes=bloom.num_hashes,
+            duration_s=round(elapsed, 3),
+        )
+
+    def _publish(self) -> None:
+        assert self._bloom is not None
+        EMAIL_FILTER_ENTRIES.set(self._bloom.count)
+        EMAIL_FILTER_ESTIMATED_FPR.set(self._bloom.estimated_false_positive_rate)
+
+
+email_filter = EmailExistenceFilter(
+    error_rate=settings.EMAIL_FILTER_ERROR_RATE,
+    headroom=settings.EMAIL_FILTER_HEADROOM,
+)
@@ -5,7 +5,8 @@ from datetime import datetime, timedelta, timezone
 
 import structlog
 from passlib.context import CryptContext
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import jwt
@@ -17,11 +18,16 @@ from app.exceptions import (
 )
 from app.models.user import User
 from app.schemas.user import RegisterRequest, UpdateUserRequest, UserResponse, TokenResponse
+from app.services.email_filter import email_filter, normalize_email
 
 logger = structlog.get_logger(__name__)
 
 _pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Verified against when no account matches, so unknown-email logins cost the
+# same single bcrypt verify as real ones. Built at import, never per request.
+_DUMMY_HASH = _pwd_context.hash("fleetbite-login-timing-equalizer")
+
 
 class UserService:
     def __init__(self, db: AsyncSession) -> None:
@@ -49,9 +55,15 @@ class UserService:
         return jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
 
     async def authenticate(self, email: str, password: str) -> TokenResponse:
-        result = await self._db.execute(select(User).where(User.email == email))
+        # Deliberately bypasses the email filter and always runs one bcrypt
+        # verification, so response time does not reveal whether an account exists.
+        result = await self._db.execute(
+            select(User).where(func.lower(User.email) == normalize_email(email))
+        )
         user = result.scalar_one_or_none()
-        if not user or not self._verify_password(password, user.hashed_password):
+        hashed = user.hashed_password if user else _DUMMY_HASH
+        password_ok = self._verify_password(password, hashed)
+        if not user or not password_ok:
             raise InvalidCredentialsError("Invalid email or password")
         logger.info("user_authenticated", user_id=str(user.id))
         token = self._create_access_token(user)
@@ -62,19 +74,31 @@ class UserService:
     # ------------------------------------------------------------------
 
     async def register(self, request: RegisterRequest) -> UserResponse:
-        # Check duplicate email
-        result = await self._db.execute(select(User).where(User.email == request.email))
-        if result.scalar_one_or_none():
-            raise DuplicateEmailError(f"Email already registered: {request.email}")
+        email = normalize_email(request.email)
+        # Check duplicate email, unless the filter has never seen it
+        if email_filter.might_contain(email):
+            result = await self._db.execute(
+                select(User).where(func.lower(User.email) == email)
+            )
+            if result.scalar_one_or_none():
+                raise DuplicateEmailError(f"Email already registered: {email}")
+            email_filter.record_false_positive()
 
         user = User(
-            email=request.email,
+            email=email,
             hashed_password=self._hash_password(request.password),
             full_name=request.full_name,
             phone=request.phone,
         )
         self._db.add(user)
-        await self._db.commit()
+        try:
+            await self._db.commit()
+        except IntegrityError as exc:
+            # Concurrent registration, or a write this worker's filter missed
+            await self._db.rollback()
+            email_filter.add(email)
+            raise DuplicateEmailError(f"Email already registered: {email}") from exc
+        email_filter.add(email)
         await self._db.refresh(user)
         logger.info("user_registered", user_id=str(user.id), email=user.email)
         return UserResponse.model_validate(user)
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator
+from pathlib import Path
+
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from app.models.user import Base, User
+from app.services.email_filter import BloomFilter, EmailExistenceFilter, normalize_email
+
+
+@pytest.fixture
+async def seeded_engine(tmp_path: Path) -> AsyncGenerator[AsyncEngine, None]:
+    """SQLite-backed engine holding one user stored with a mixed-case email."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'users.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(
+            insert(User).values(
+                email="Legacy.User@Example.com",
+                hashed_password="not-a-real-hash",
+                full_name="Legacy User",
+            )
+        )
+    yield engine
+    await engine.dispose()
+
+
+class TestNormalizeEmail:
+    def test_lowercases_and_strips(self) -> None:
+        """Mixed-case and padded input should map to one canonical form."""
+        assert normalize_email("  Jane.Doe@Example.COM ") == "jane.doe@example.com"
+
+
+class TestBloomFilter:
+    def test_added_items_are_always_present(self) -> None:
+        """A Bloom filter must never report a false negative."""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        emails = [f"user{i}@example.com" for i in range(1000)]
+        for email in emails:
+            bloom.add(email)
+        assert all(email in bloom for email in emails)
+
+    def test_false_positive_rate_within_target(self) -> None:
+        """At capacity, observed false positives should stay near the target."""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"user{i}@example.com")
+        hits = sum(f"other{i}@example.com" in bloom for i in range(10000))
+        assert hits / 10000 < 0.03
+        assert bloom.estimated_false_positive_rate < 0.02
+
+
+class TestEmailExistenceFilter:
+    def test_unloaded_filter_defers_to_database(self) -> None:
+        """Before the startup rebuild every email is reported as possibly present."""
+        email_filter = EmailExistenceFilter()
+        assert not email_filter.ready
+        assert email_filter.might_contain("new@example.com")
+
+    async def test_rebuild_streams_stored_emails(
+        self, seeded_engine: AsyncEngine
+    ) -> None:
+        """Rebuild should load existing emails and publish filter gauges."""
+        email_filter = EmailExistenceFilter()
+        await email_filter.rebuild(seeded_engine, batch_size=1)
+
+        assert email_filter.ready
+        assert email_filter.might_contain("legacy.user@example.com")
+        assert not email_filter.might_contain("unknown@example.com")
+        assert REGISTRY.get_sample_value("usr_email_filter_entries") == 1
+        elapsed = REGISTRY.get_sample_value("usr_email_filter_rebuild_seconds")
+        assert elapsed is not None and elapsed > 0
+
+    async def test_add_is_case_insensitive(self, seeded_engine: AsyncEngine) -> None:
+        """Writes are normalized so later mixed-case lookups still match."""
+        email_filter = EmailExistenceFilter()
+        await email_filter.rebuild(seeded_engine)
+        email_filter.add("Jane@Example.com")
+        assert email_filter.might_contain("jane@example.COM")
+        assert not email_filter.might_contain("someone-else@example.com")
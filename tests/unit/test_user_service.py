@@ -69,6 +69,56 @@ class TestUserServiceRegister:
         with pytest.raises(DuplicateEmailError):
             await svc.register(request)
 
+    async def test_register_skips_duplicate_check_for_unseen_email(self) -> None:
+        """An email the filter has never seen should not trigger a DB pre-check."""
+        from unittest.mock import patch
+
+        mock_db = AsyncMock()
+        mock_db.add = MagicMock()
+        mock_db.commit = AsyncMock(side_effect=RuntimeError("stop after insert"))
+
+        svc = UserService(mock_db)
+        request = RegisterRequest(
+            email="Brand.New@Example.com",
+            password="s3cur3P@ss",
+            full_name="Brand New",
+        )
+        email_filter = MagicMock()
+        email_filter.might_contain.return_value = False
+        with patch("app.services.user_service.email_filter", email_filter):
+            with pytest.raises(RuntimeError):
+                await svc.register(request)
+        mock_db.execute.assert_not_awaited()
+        assert mock_db.add.call_args.args[0].email == "brand.new@example.com"
+
+    async def test_register_stale_filter_falls_back_to_unique_index(self) -> None:
+        """A unique-index violation after a skipped pre-check is still a duplicate."""
+        from unittest.mock import patch
+
+        from sqlalchemy.exc import IntegrityError
+
+        mock_db = AsyncMock()
+        mock_db.add = MagicMock()
+        mock_db.commit = AsyncMock(
+            side_effect=IntegrityError("INSERT INTO usr_users", {}, Exception())
+        )
+        mock_db.rollback = AsyncMock()
+
+        svc = UserService(mock_db)
+        request = RegisterRequest(
+            email="Taken@Example.com",
+            password="s3cur3P@ss",
+            full_name="Taken Elsewhere",
+        )
+        email_filter = MagicMock()
+        email_filter.might_contain.return_value = False
+        with patch("app.services.user_service.email_filter", email_filter):
+            with pytest.raises(DuplicateEmailError):
+                await svc.register(request)
+        mock_db.execute.assert_not_awaited()
+        mock_db.rollback.assert_awaited_once()
+        email_filter.add.assert_called_once_with("taken@example.com")
+
 
 class TestUserServiceAuthenticate:
     async def test_authenticate_invalid_password_raises(self) -> None:
@@ -96,6 +146,24 @@ class TestUserServiceAuthenticate:
         with pytest.raises(InvalidCredentialsError):
             await svc.authenticate("ghost@example.com", "anypassword")
 
+    async def test_authenticate_unknown_email_still_verifies_once(self) -> None:
+        """Unknown emails must pay one bcrypt verify against the dummy hash."""
+        from unittest.mock import patch
+
+        from app.services.user_service import _DUMMY_HASH
+
+        mock_db = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = None
+        mock_db.execute = AsyncMock(return_value=mock_result)
+
+        svc = UserService(mock_db)
+        verify = MagicMock(return_value=False)
+        with patch.object(svc, "_verify_password", verify):
+            with pytest.raises(InvalidCredentialsError):
+                await svc.authenticate("ghost@example.com", "anypassword")
+        verify.assert_called_once_with("anypassword", _DUMMY_HASH)
+
 
 class TestUserServiceGetById:
     async def test_get_nonexistent_user_raises(self) -> None: